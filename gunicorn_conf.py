@@ -0,0 +1,31 @@
+"""Gunicorn settings for serving the Flask app in production.
+
+Run with: gunicorn -c gunicorn_conf.py app:app
+
+Pick another worker class with KTS_WORKER_CLASS (e.g. KTS_WORKER_CLASS=sync)
+rather than -k, so the gevent patching below follows the choice.
+"""
+import os
+
+# gevent workers multiplex connections on greenlets, so a slow client only
+# holds a greenlet while the page is written out, not a whole worker process.
+worker_class = os.environ.get('KTS_WORKER_CLASS', 'gevent')
+
+# The app is imported once in the master and forked into the workers, so
+# index.html is read and gzipped a single time and its bytes are shared
+# copy-on-write. That import pulls in ssl and socket before any gevent worker
+# starts, so with gevent workers the stdlib has to be patched here, ahead of it.
+if worker_class == 'gevent':
+    from gevent import monkey
+
+    monkey.patch_all()
+preload_app = True
+
+# Only NGINX (deploy/nginx.conf) talks to Gunicorn, so it listens on loopback.
+# Set KTS_BIND, e.g. to 0.0.0.0:5000, when running without the proxy.
+bind = os.environ.get('KTS_BIND', '127.0.0.1:5000')
+
+workers = (2 * (os.cpu_count() or 1)) + 1
+worker_connections = 1000
+# Keep above keepalive_timeout in deploy/nginx.conf's upstream block.
+keepalive = 5